@@ -28,7 +28,7 @@ def load_mtr_opening_dates() -> pd.DataFrame:
     mtr_stations_file = project_root / 'data' / 'raw' / 'mtr' / 'mtr_stations.xlsx'
     
     if mtr_stations_file.exists():
-        df = pd.read_excel(mtr_stations_file)
+        df = pd.read_excel(mtr_stations_file, engine='calamine')
         
         # Create approximate opening dates (placeholder logic)
         # In reality, these should be researched from MTR history
@@ -0,0 +1,736 @@
+#!/usr/bin/env python3
+"""
+Download TPU boundary data from ArcGIS/Esri China open data portals.
+
+Usage:
+    python download_tpu.py [all]          # every census year
+    python download_tpu.py year 2016      # a single year
+    python download_tpu.py try2021        # only the 2021 fallback sources
+
+Pass --refresh to revalidate existing downloads instead of reusing them, and
+--precision 0 to request full-precision geometry from ArcGIS query endpoints.
+"""
+
+import argparse
+import functools
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+import ijson
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Shared HTTP session: keep-alive connections are reused across requests to
+# the same ArcGIS host instead of paying a fresh TCP/TLS handshake per call.
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': 'application/json',
+    # GeoJSON coordinates compress very well; requests decodes transparently
+    # (including for iter_content on streamed responses)
+    'Accept-Encoding': 'gzip, deflate'
+})
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+))
+
+# Liveness probes get a single attempt: retrying a timed-out probe would cost
+# several PROBE_TIMEOUTs plus backoff for each unreachable candidate
+_PROBE_SESSION = requests.Session()
+_PROBE_SESSION.headers.update(_SESSION.headers)
+_PROBE_SESSION.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=0))
+
+# Get project root (2 levels up from this script)
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+OUTPUT_DIR = PROJECT_ROOT / 'data' / 'raw' / 'tpu'
+
+YEARS = ('2001', '2006', '2011', '2016', '2021')
+
+# Planning Department TPU layers on the Esri China Open Data Portal - the
+# primary source for every year
+PLAND_FEATURE_SERVICE = "https://services3.arcgis.com/6j1KwZfY2fZrfNMR/arcgis/rest/services/TPU_SB_VC_{year}_PlanD_gdb/FeatureServer/0"
+
+# TPU data sources - ArcGIS REST API endpoints
+TPU_SOURCES = {
+    '2021': {
+        'name': '2021 TPU Boundaries',
+        'base_url': 'https://opendata.arcgis.com/api/v3/datasets',
+        'dataset_id': 'c4c71147985b4be1aade0fb1401530c2',
+        'feature_service': 'https://services1.arcgis.com/EbqNbzKqJqFqFqFq/arcgis/rest/services/TPU_2021/FeatureServer/0'
+    },
+    '2016': {
+        'name': '2016 TPU Boundaries',
+        'webmap_id': '9800de8d31f646a9b191a0c8f5cd36c6',
+        'feature_service': None  # Will need to extract from webmap
+    },
+    '2011': {
+        'name': '2011 TPU Boundaries',
+        'dataset_id': 'boundaries-of-tertiary-planning-units-street-blocks-village-clusters-in-hong-kong-for-2011-population-census',
+        'feature_service': 'https://opendata.arcgis.com/api/v3/datasets/boundaries-of-tertiary-planning-units-street-blocks-village-clusters-in-hong-kong-for-2011-population-census'
+    },
+    '2006': {
+        'name': '2006 TPU Boundaries',
+        'dataset_id': 'esrihk::boundaries-of-tertiary-planning-units-street-blocks-village-clusters-in-hong-kong-for-2006-population-by-census-1',
+        'feature_service': 'https://opendata.arcgis.com/api/v3/datasets/esrihk::boundaries-of-tertiary-planning-units-street-blocks-village-clusters-in-hong-kong-for-2006-population-by-census-1'
+    },
+    '2001': {
+        'name': '2001 TPU Boundaries',
+        'dataset_id': 'boundaries-of-tertiary-planning-units-street-blocks-village-clusters-in-hong-kong-for-2001-population-census-1',
+        'feature_service': 'https://opendata.arcgis.com/api/v3/datasets/boundaries-of-tertiary-planning-units-street-blocks-village-clusters-in-hong-kong-for-2001-population-census-1'
+    }
+}
+
+# Direct GeoJSON downloads / REST query endpoints, tried when the PlanD layer
+# for a year is unavailable. Entries are either a URL string (direct download)
+# or a (url, is_rest_api) tuple.
+ALTERNATIVE_SOURCES = {
+    '2021': [
+        'https://opendata.arcgis.com/datasets/c4c71147985b4be1aade0fb1401530c2_0.geojson',
+        'https://opendata.esrichina.hk/datasets/c4c71147985b4be1aade0fb1401530c2_0.geojson',
+        'https://www.geodata.gov.hk/gs/api/v1.0.0/collections/TPU_2021/items?f=json&limit=10000',
+        # Try REST API query
+        ('https://services1.arcgis.com/EbqNbzKqJqFqFqFq/arcgis/rest/services/TPU_2021/FeatureServer/0/query', True),
+        ('https://services3.arcgis.com/6j1KwZfY2fZrfNMR/arcgis/rest/services/TPU_SB_VC_2021_PlanD/FeatureServer/0/query', True),
+        'https://opendata.arcgis.com/api/v3/datasets/c4c71147985b4be1aade0fb1401530c2_0/downloads/data?format=geojson&spatialRefId=4326'
+    ],
+    '2011': [
+        'https://opendata.arcgis.com/datasets/boundaries-of-tertiary-planning-units-street-blocks-village-clusters-in-hong-kong-for-2011-population-census.geojson',
+        'https://opendata.esrichina.hk/datasets/boundaries-of-tertiary-planning-units-street-blocks-village-clusters-in-hong-kong-for-2011-population-census.geojson',
+        # Try REST API - common Esri China pattern
+        ('https://services1.arcgis.com/EbqNbzKqJqFqFqFq/arcgis/rest/services/TPU_2011/FeatureServer/0/query', True),
+        'https://opendata.arcgis.com/api/v3/datasets/boundaries-of-tertiary-planning-units-street-blocks-village-clusters-in-hong-kong-for-2011-population-census/downloads/data?format=geojson&spatialRefId=4326'
+    ],
+    '2006': [
+        'https://opendata.arcgis.com/datasets/esrihk::boundaries-of-tertiary-planning-units-street-blocks-village-clusters-in-hong-kong-for-2006-population-by-census-1.geojson'
+    ],
+    '2001': [
+        'https://opendata.arcgis.com/datasets/boundaries-of-tertiary-planning-units-street-blocks-village-clusters-in-hong-kong-for-2001-population-census-1.geojson',
+        'https://opendata.esrichina.hk/datasets/boundaries-of-tertiary-planning-units-street-blocks-village-clusters-in-hong-kong-for-2001-population-census-1.geojson',
+        'https://opendata.arcgis.com/api/v3/datasets/boundaries-of-tertiary-planning-units-street-blocks-village-clusters-in-hong-kong-for-2001-population-census-1/downloads/data?format=geojson&spatialRefId=4326'
+    ]
+}
+
+# Query parameters for REST API query endpoints
+QUERY_PARAMS = {
+    'where': '1=1',
+    'outFields': '*',
+    'f': 'geojson',
+    'outSR': '4326',  # WGS84
+    'resultRecordCount': 10000
+}
+
+# Decimal places requested for query geometry (6 places is ~10 cm at Hong
+# Kong's latitude); ArcGIS otherwise ships ~15 significant digits per
+# coordinate. 0 requests full precision.
+GEOMETRY_PRECISION = 6
+
+# Years downloaded concurrently (kept small to stay polite to ArcGIS)
+MAX_CONCURRENT_DOWNLOADS = 5
+
+# Pagination pages fetched concurrently per layer (more tends to trigger 429s)
+MAX_PAGE_WORKERS = 4
+
+# Dataset ID -> Feature Service URL resolutions, reused across runs
+URL_CACHE_FILE = PROJECT_ROOT / '.cache' / 'arcgis_urls.json'
+URL_CACHE_TTL = 7 * 24 * 60 * 60
+_URL_CACHE_LOCK = threading.Lock()
+
+# Per-request timeout for raced fallback candidates; a race tolerates
+# shorter probes than a single sequential attempt would
+CANDIDATE_TIMEOUT = 20
+# Liveness probes only fetch a count or headers, so a short timeout suffices
+PROBE_TIMEOUT = 5
+
+
+def _part_file(output_file: Path, tag=None) -> Path:
+    """
+    Temp path next to output_file; same directory keeps os.replace atomic.
+    """
+    suffix = '.part' if tag is None else f'.{tag}.part'
+    return output_file.with_name(output_file.name + suffix)
+
+
+def _write_atomic(output_file: Path, payload: bytes):
+    """
+    Write payload via a temp file that is moved into place only once complete,
+    so a crash or error never leaves a truncated file behind.
+    """
+    tmp_file = _part_file(output_file)
+    try:
+        with open(tmp_file, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_file, output_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+
+def _is_cached(output_file: Path) -> bool:
+    """
+    Treat an existing, non-trivial output file as already downloaded.
+    """
+    return output_file.exists() and output_file.stat().st_size > 1024
+
+
+def _conditional_headers(output_file: Path) -> dict:
+    """
+    Build If-None-Match / If-Modified-Since headers from the validators saved
+    alongside a previous download, so an unchanged layer comes back as 304.
+    """
+    validator_file = output_file.with_suffix('.etag')
+    if not (output_file.exists() and validator_file.exists()):
+        return {}
+    
+    etag, _, last_modified = validator_file.read_text(encoding='utf-8').partition('\n')
+    headers = {}
+    if etag.strip():
+        headers['If-None-Match'] = etag.strip()
+    if last_modified.strip():
+        headers['If-Modified-Since'] = last_modified.strip()
+    return headers
+
+
+def _save_validators(output_file: Path, response):
+    """
+    Store the ETag / Last-Modified of a successful download in a sidecar file.
+    """
+    etag = response.headers.get('ETag', '')
+    last_modified = response.headers.get('Last-Modified', '')
+    if etag or last_modified:
+        _write_atomic(output_file.with_suffix('.etag'), f"{etag}\n{last_modified}".encode('utf-8'))
+
+
+class CandidateCancelled(Exception):
+    """
+    Raised inside a race candidate once another candidate has won.
+    """
+
+
+def _check_cancelled(cancel: threading.Event, response=None):
+    """
+    Abort a candidate whose race is already decided, closing its connection.
+    """
+    if cancel is not None and cancel.is_set():
+        if response is not None:
+            response.close()
+        raise CandidateCancelled("another source won the race")
+
+
+def _stream_to_file(response, output_file: Path, cancel: threading.Event = None):
+    """
+    Write a streamed response body straight to disk without parsing it.
+    
+    If cancel is set while streaming, the connection is closed and
+    CandidateCancelled is raised.
+    """
+    with open(output_file, 'wb') as f:
+        for chunk in response.iter_content(chunk_size=65536):
+            _check_cancelled(cancel, response)
+            f.write(chunk)
+
+
+def _count_features(geojson_file: Path) -> int:
+    """
+    Count the features in a saved GeoJSON file, rejecting bodies without any.
+    
+    The file is scanned with a streaming parser, so only one feature is held
+    in memory at a time.
+    """
+    with open(geojson_file, 'rb') as f:
+        feature_count = sum(1 for _ in ijson.items(f, 'features.item'))
+    if not feature_count:
+        raise ValueError("Response contains no GeoJSON features")
+    return feature_count
+
+
+def _scan_query_result(geojson_file: Path):
+    """
+    Inspect a saved ArcGIS query response in one streaming pass.
+    
+    Returns (feature_count, exceeded_transfer_limit). GeoJSON output reports
+    the transfer-limit flag under 'properties', Esri JSON at the top level.
+    Raises ValueError if the body has no 'features' array.
+    """
+    has_features = False
+    exceeded = False
+    feature_count = 0
+    with open(geojson_file, 'rb') as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix == 'features.item' and event == 'start_map':
+                feature_count += 1
+            elif prefix == 'features' and event == 'start_array':
+                has_features = True
+            elif prefix in ('exceededTransferLimit', 'properties.exceededTransferLimit') and value is True:
+                exceeded = True
+    if not has_features:
+        raise ValueError("Response structure unexpected: no 'features' array")
+    return feature_count, exceeded
+
+
+def _with_precision(params: dict, precision: int) -> dict:
+    """
+    Add server-side coordinate quantization to ArcGIS query parameters.
+    """
+    if not precision:
+        return params
+    return {**params, 'geometryPrecision': precision}
+
+
+def _get_total(feature_service_url: str, where_clause: str = "1=1") -> int:
+    """
+    Get the total number of features matching a query (returnCountOnly).
+    """
+    params = {
+        'where': where_clause,
+        'returnCountOnly': 'true',
+        'f': 'json'
+    }
+    response = _SESSION.get(f"{feature_service_url}/query", params=params, timeout=30)
+    response.raise_for_status()
+    return orjson.loads(response.content)['count']
+
+
+def download_from_arcgis_rest(feature_service_url: str, output_file: Path, where_clause: str = "1=1",
+                              refresh: bool = False, precision: int = GEOMETRY_PRECISION) -> bool:
+    """
+    Download data from ArcGIS REST Feature Service.
+    
+    An existing download is reused as-is unless refresh is set, in which case
+    it is revalidated with a conditional GET.
+    """
+    if not refresh and _is_cached(output_file):
+        print(f"  ↷ cached {output_file}")
+        return True
+    
+    print(f"  Querying: {feature_service_url}")
+    
+    # Query parameters
+    params = _with_precision({
+        'where': where_clause,
+        'outFields': '*',
+        'f': 'geojson',
+        'outSR': '4326'  # WGS84
+    }, precision)
+    
+    try:
+        # Try to get all features (may need pagination); the body is
+        # streamed to disk rather than held in memory
+        response = _SESSION.get(f"{feature_service_url}/query", params=params,
+                                headers=_conditional_headers(output_file) if refresh else {},
+                                timeout=60, stream=True)
+        if response.status_code == 304:
+            response.close()
+            print(f"  ↷ not modified {output_file}")
+            return True
+        response.raise_for_status()
+        
+        tmp_file = _part_file(output_file, 'query')
+        try:
+            _stream_to_file(response, tmp_file)
+            feature_count, exceeded = _scan_query_result(tmp_file)
+            
+            if exceeded:
+                print("  Large dataset detected, fetching pages in parallel...")
+                record_count = 1000
+                total = _get_total(feature_service_url, where_clause)
+                
+                def fetch_page(offset):
+                    page_params = {**params, 'resultOffset': offset, 'resultRecordCount': record_count}
+                    page_response = _SESSION.get(f"{feature_service_url}/query", params=page_params, timeout=60)
+                    page_response.raise_for_status()
+                    return orjson.loads(page_response.content).get('features', [])
+                
+                # With the total known up front every offset can be requested at once
+                with ThreadPoolExecutor(max_workers=MAX_PAGE_WORKERS) as executor:
+                    pages = list(executor.map(fetch_page, range(0, total, record_count)))
+                
+                data = {
+                    'type': 'FeatureCollection',
+                    'features': [feature for page in pages for feature in page]
+                }
+                feature_count = len(data['features'])
+                
+                # Compact output: the file is machine-consumed and pretty-printing
+                # roughly doubles its size
+                _write_atomic(output_file, orjson.dumps(data))
+            else:
+                # Single response: keep the body as received
+                os.replace(tmp_file, output_file)
+        finally:
+            tmp_file.unlink(missing_ok=True)
+        _save_validators(output_file, response)
+        
+        print(f"  ✓ Downloaded {feature_count} features to {output_file}")
+        return True
+    
+    except Exception as e:
+        print(f"  ✗ Error downloading: {e}")
+        return False
+
+
+def _probe_candidate(url: str, is_rest_api: bool):
+    """
+    Cheaply check that a candidate is alive and non-empty before the full GET.
+    
+    ArcGIS endpoints are asked for a feature count; direct downloads get a
+    HEAD request. Raises ValueError if the candidate should be skipped.
+    """
+    if is_rest_api:
+        probe = _PROBE_SESSION.get(url, params={'f': 'json', 'returnCountOnly': 'true', 'where': '1=1'},
+                                   timeout=PROBE_TIMEOUT)
+        if probe.status_code != 200:
+            raise ValueError(f"Probe status {probe.status_code} from {url[:80]}")
+        if orjson.loads(probe.content).get('count', 0) <= 0:
+            raise ValueError(f"No features at {url[:80]}")
+    else:
+        probe = _PROBE_SESSION.head(url, timeout=PROBE_TIMEOUT, allow_redirects=True)
+        if probe.status_code != 200:
+            raise ValueError(f"Probe status {probe.status_code} from {url[:80]}")
+        # Servers that omit Content-Length still get the full GET
+        content_length = probe.headers.get('Content-Length')
+        if content_length is not None and int(content_length) <= 1024:
+            raise ValueError(f"Response too small ({content_length} bytes) from {url[:80]}")
+
+
+def _fetch_candidate(url_item, tmp_file: Path, conditional_headers: dict,
+                     precision: int = GEOMETRY_PRECISION, cancel: threading.Event = None):
+    """
+    Download one candidate source into its own temp file.
+    
+    Returns (tmp_file, response, feature_count), with tmp_file None when the
+    server answered 304 Not Modified. Raises if the candidate is unusable or
+    is cancelled via cancel because another candidate won.
+    """
+    # Handle tuple (url, is_rest_api) or string
+    if isinstance(url_item, tuple):
+        url, is_rest_api = url_item
+    else:
+        url, is_rest_api = url_item, False
+    
+    if is_rest_api:
+        params = _with_precision(QUERY_PARAMS, precision)
+    else:
+        # Direct download URLs carrying a query string are used as-is
+        params = {'outSR': '4326'} if '?' not in url else None
+    
+    print(f"  Trying: {url[:80]}...")
+    _probe_candidate(url, is_rest_api)
+    _check_cancelled(cancel)
+    response = _SESSION.get(url, params=params, headers=conditional_headers,
+                            timeout=CANDIDATE_TIMEOUT, stream=True)
+    _check_cancelled(cancel, response)
+    if response.status_code == 304:
+        return None, response, None
+    if response.status_code != 200:
+        raise ValueError(f"Status {response.status_code} from {url[:80]}")
+    
+    try:
+        _stream_to_file(response, tmp_file, cancel)
+        return tmp_file, response, _count_features(tmp_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+
+def _discard_candidate(future):
+    """
+    Remove the temp file of a candidate that lost the race.
+    """
+    if future.cancelled() or future.exception() is not None:
+        return
+    tmp_file = future.result()[0]
+    if tmp_file is not None:
+        tmp_file.unlink(missing_ok=True)
+
+
+def _download_first_valid(urls: list, output_file: Path, refresh: bool = False,
+                          precision: int = GEOMETRY_PRECISION) -> bool:
+    """
+    Race candidate URLs and keep the first one that returns GeoJSON.
+    
+    Entries are URL strings (direct downloads) or (url, is_rest_api) tuples.
+    All candidates are requested at once, so dead endpoints cost one timeout
+    in parallel rather than one timeout each.
+    """
+    conditional_headers = _conditional_headers(output_file) if refresh else {}
+    
+    # Set once a winner is picked; losers notice it between chunks and stop
+    cancel = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=len(urls))
+    futures = [
+        executor.submit(_fetch_candidate, url_item, _part_file(output_file, i),
+                        conditional_headers, precision, cancel)
+        for i, url_item in enumerate(urls)
+    ]
+    try:
+        for future in as_completed(futures):
+            try:
+                tmp_file, response, feature_count = future.result()
+            except Exception as e:
+                print(f"  Error: {str(e)[:100]}")
+                continue
+            
+            if tmp_file is None:
+                print(f"  ↷ not modified {output_file}")
+                return True
+            
+            os.replace(tmp_file, output_file)
+            _save_validators(output_file, response)
+            print(f"  ✓ Downloaded {feature_count} features to {output_file}")
+            return True
+    finally:
+        # Stop the losers at their next chunk (their .part files are removed
+        # as they abort); candidates that already finished drop theirs here
+        cancel.set()
+        for future in futures:
+            future.add_done_callback(_discard_candidate)
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    return False
+
+
+def _load_url_cache() -> dict:
+    """
+    Load the on-disk dataset ID -> Feature Service URL cache.
+    """
+    try:
+        return orjson.loads(URL_CACHE_FILE.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+
+
+def _update_url_cache(dataset_id: str, url):
+    """
+    Store a resolved Feature Service URL, or drop the entry when url is None.
+    """
+    with _URL_CACHE_LOCK:
+        cache = _load_url_cache()
+        if url is None:
+            cache.pop(dataset_id, None)
+        else:
+            cache[dataset_id] = {'url': url, 'resolved_at': time.time()}
+        URL_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomic(URL_CACHE_FILE, orjson.dumps(cache))
+
+
+@functools.lru_cache(maxsize=None)
+def get_feature_service_from_dataset(dataset_id: str):
+    """
+    Get feature service URL from dataset ID via ArcGIS Open Data API.
+    
+    Resolutions are effectively static, so they are cached in-process and on
+    disk for URL_CACHE_TTL seconds.
+    """
+    entry = _load_url_cache().get(dataset_id)
+    if entry and time.time() - entry['resolved_at'] < URL_CACHE_TTL:
+        return entry['url']
+    
+    api_url = f"https://opendata.arcgis.com/api/v3/datasets/{dataset_id}"
+    feature_service = None
+    
+    try:
+        response = _SESSION.get(api_url, timeout=30)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        
+        # Try to find feature service URL in the response
+        if 'data' in data and 'services' in data['data']:
+            services = data['data']['services']
+            for service in services:
+                if service.get('type') == 'FeatureServer':
+                    feature_service = service.get('url')
+                    break
+        
+        # Alternative: try to construct from dataset metadata
+        if not feature_service and 'data' in data and 'url' in data['data']:
+            feature_service = data['data']['url']
+    
+    except Exception as e:
+        print(f"  Error getting feature service URL: {e}")
+    
+    if feature_service:
+        _update_url_cache(dataset_id, feature_service)
+    return feature_service
+
+
+def _invalidate_feature_service(dataset_id: str):
+    """
+    Forget a cached resolution whose Feature Service no longer works.
+    """
+    get_feature_service_from_dataset.cache_clear()
+    _update_url_cache(dataset_id, None)
+
+
+def download_tpu_data(year: str, refresh: bool = False, precision: int = GEOMETRY_PRECISION) -> bool:
+    """
+    Download TPU boundary data for a year from the Feature Service in TPU_SOURCES.
+    """
+    source = TPU_SOURCES.get(year)
+    if not source:
+        print(f"Unknown year: {year}")
+        return False
+    
+    output_file = OUTPUT_DIR / f'tpu_boundaries_{year}.geojson'
+    
+    # If feature service URL is provided, use it directly
+    if source.get('feature_service'):
+        feature_service = source['feature_service']
+        
+        # If it's a dataset URL, try to get the actual feature service
+        resolved = 'api/v3/datasets' in feature_service
+        if resolved:
+            feature_service = get_feature_service_from_dataset(source.get('dataset_id', ''))
+            if not feature_service:
+                print(f"  ✗ Could not determine feature service URL")
+                return False
+        
+        success = download_from_arcgis_rest(feature_service, output_file, refresh=refresh, precision=precision)
+        if not success and resolved:
+            # The cached resolution may be stale; look it up again next time
+            _invalidate_feature_service(source.get('dataset_id', ''))
+        return success
+    
+    # For 2016, we need to extract from webmap
+    elif source.get('webmap_id'):
+        print(f"  Note: 2016 data requires manual extraction from webmap")
+        print(f"  Webmap ID: {source['webmap_id']}")
+        print(f"  Please download manually or use alternative source")
+        return False
+    
+    return False
+
+
+def _download_year(year: str, refresh: bool = False, precision: int = GEOMETRY_PRECISION) -> bool:
+    """
+    Download TPU boundaries for one census year.
+    
+    Tries the PlanD layer first, then ALTERNATIVE_SOURCES, then the Feature
+    Service listed in TPU_SOURCES.
+    """
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    output_file = OUTPUT_DIR / f'tpu_boundaries_{year}.geojson'
+    
+    if not refresh and _is_cached(output_file):
+        print(f"  ↷ cached {output_file}")
+        return True
+    
+    print(f"\nDownloading {year} TPU boundaries...")
+    
+    if download_from_arcgis_rest(PLAND_FEATURE_SERVICE.format(year=year), output_file,
+                                 refresh=refresh, precision=precision):
+        return True
+    
+    if year in ALTERNATIVE_SOURCES and _download_first_valid(ALTERNATIVE_SOURCES[year], output_file,
+                                                             refresh, precision):
+        return True
+    
+    # Fallback to REST API method
+    return download_tpu_data(year, refresh=refresh, precision=precision)
+
+
+def download_tpu_2021(refresh: bool = False, precision: int = GEOMETRY_PRECISION) -> bool:
+    """
+    Download 2021 TPU boundaries from the 2021 fallback sources only.
+    """
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    output_file = OUTPUT_DIR / 'tpu_boundaries_2021.geojson'
+    
+    if not refresh and _is_cached(output_file):
+        print(f"  ↷ cached {output_file}")
+        return True
+    
+    print("Downloading 2021 TPU boundaries...")
+    if _download_first_valid(ALTERNATIVE_SOURCES['2021'], output_file, refresh, precision):
+        return True
+    
+    print("\n⚠️  Could not download 2021 TPU data automatically.")
+    print("   Manual download option:")
+    print("   https://data.gov.hk/en-data/dataset/hk-pland-pland1-boundaries-of-tpu-sb-vc")
+    print("   Save the file as: data/raw/tpu/tpu_boundaries_2021.geojson")
+    return False
+
+
+def download_all(years=YEARS, refresh: bool = False, precision: int = GEOMETRY_PRECISION) -> dict:
+    """
+    Download TPU boundaries for several years and print a summary.
+    """
+    print("=" * 60)
+    print("TPU Boundary Data Downloader")
+    print("=" * 60)
+    
+    # Years are independent and I/O-bound: download them concurrently so
+    # wall-clock is bounded by the slowest year instead of the sum of all.
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_DOWNLOADS) as executor:
+        results = dict(zip(years, executor.map(lambda year: _download_year(year, refresh, precision), years)))
+    
+    print("\n" + "=" * 60)
+    print("Download Summary:")
+    for year, success in results.items():
+        status = "✓ Success" if success else "✗ Failed"
+        print(f"  {year}: {status}")
+    print("=" * 60)
+    return results
+
+
+def _non_negative_int(value: str) -> int:
+    """
+    argparse type for --precision: an integer that is zero or more.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected an integer, got {value!r}")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or more, got {number}")
+    return number
+
+
+def _add_common_options(parser: argparse.ArgumentParser, top_level: bool = True):
+    """
+    Register options accepted both before and after the subcommand.
+    
+    Subcommand copies default to SUPPRESS so they do not overwrite a value
+    given before the subcommand.
+    """
+    parser.add_argument('--refresh', action='store_true', default=False if top_level else argparse.SUPPRESS,
+                        help='revalidate existing downloads with conditional GETs instead of reusing them')
+    parser.add_argument('--precision', type=_non_negative_int, default=GEOMETRY_PRECISION if top_level else argparse.SUPPRESS,
+                        help=f'decimal places of returned coordinates (default {GEOMETRY_PRECISION}; '
+                             '0 for full precision, e.g. survey-grade geometry)')
+
+
+def main(argv=None):
+    """
+    Command-line entry point.
+    """
+    parser = argparse.ArgumentParser(description='Download TPU boundary data for Hong Kong census years.')
+    _add_common_options(parser)
+    subparsers = parser.add_subparsers(dest='command')
+    
+    _add_common_options(subparsers.add_parser('all', help='download every census year (default)'),
+                        top_level=False)
+    year_parser = subparsers.add_parser('year', help='download a single census year')
+    year_parser.add_argument('year', choices=YEARS)
+    _add_common_options(year_parser, top_level=False)
+    _add_common_options(subparsers.add_parser('try2021', help='try only the 2021 fallback sources'),
+                        top_level=False)
+    
+    args = parser.parse_args(argv)
+    
+    if args.command == 'year':
+        download_all(years=(args.year,), refresh=args.refresh, precision=args.precision)
+    elif args.command == 'try2021':
+        download_tpu_2021(refresh=args.refresh, precision=args.precision)
+    else:
+        download_all(refresh=args.refresh, precision=args.precision)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+Helpers shared by the MTR station scripts in this directory.
+"""
+
+import atexit
+import functools
+import os
+import orjson
+import threading
+import time
+from pathlib import Path
+from typing import Dict
+from urllib.parse import urlparse
+
+# Nominatim's usage policy allows at most one request per second
+RATE_LIMITS = {'nominatim.openstreetmap.org': 1.0}
+
+
+class HostRateLimiter:
+    """
+    Space requests to each host at least 1/rps seconds apart, across threads.
+    
+    Hosts without a configured rate are not limited, and only requests that
+    actually go out (not cache hits) wait for a slot.
+    """
+    
+    def __init__(self, rps: Dict[str, float]):
+        self._min_interval = {host: 1 / rate for host, rate in rps.items()}
+        self._locks = {host: threading.Lock() for host in rps}
+        self._last = dict.fromkeys(rps, 0.0)
+    
+    def acquire(self, url: str):
+        """
+        Block until a request to url's host is allowed.
+        """
+        host = urlparse(url).netloc
+        if host not in self._locks:
+            return
+        with self._locks[host]:
+            delay = self._min_interval[host] - (time.monotonic() - self._last[host])
+            if delay > 0:
+                time.sleep(delay)
+            self._last[host] = time.monotonic()
+
+
+RATE_LIMITER = HostRateLimiter(RATE_LIMITS)
+
+
+# Found coordinates are persisted across runs, keyed by lookup source and
+# station name
+GEOCODE_CACHE_FILE = Path(__file__).parent.parent.parent / '.cache' / 'geocode.json'
+
+
+def _load_geocode_cache() -> dict:
+    """
+    Load the on-disk geocode cache.
+    """
+    try:
+        return orjson.loads(GEOCODE_CACHE_FILE.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+
+
+_geocode_cache = _load_geocode_cache()
+_new_geocodes = {}
+_geocode_cache_lock = threading.Lock()
+
+
+def _save_geocode_cache():
+    """
+    Write lookups made by this run back to the on-disk geocode cache.
+    """
+    if not _new_geocodes:
+        return
+    # Merge rather than overwrite, in case another script updated the file meanwhile
+    cache = _load_geocode_cache()
+    cache.update(_new_geocodes)
+    GEOCODE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = GEOCODE_CACHE_FILE.with_name(GEOCODE_CACHE_FILE.name + '.part')
+    tmp_file.write_bytes(orjson.dumps(cache))
+    os.replace(tmp_file, GEOCODE_CACHE_FILE)
+
+
+atexit.register(_save_geocode_cache)
+
+
+def disk_cached(source: str):
+    """
+    Serve a (latitude, longitude) lookup from the geocode cache, recording new hits.
+    
+    Misses are not cached, so stations that could not be found are retried on
+    the next run.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(station_name: str, *args):
+            key = ':'.join(map(str, (source, station_name) + args))
+            if key in _geocode_cache:
+                return tuple(_geocode_cache[key])
+            lat, lon = func(station_name, *args)
+            if lat is not None and lon is not None:
+                with _geocode_cache_lock:
+                    _geocode_cache[key] = _new_geocodes[key] = [lat, lon]
+            return (lat, lon)
+        return wrapper
+    return decorator
@@ -0,0 +1,42 @@
+"""
+Read and write the MTR station table, with a Parquet copy next to the workbook.
+
+Imported by later pipeline stages as well as the data collection scripts, so
+this module has no import-time side effects.
+"""
+
+from pathlib import Path
+
+import pandas as pd
+
+
+def read_mtr_stations(excel_file) -> pd.DataFrame:
+    """
+    Read station data, preferring the Parquet sidecar if it is at least as new
+    as the workbook (i.e. the workbook has not been edited by hand since).
+    """
+    parquet_file = Path(excel_file).with_suffix('.parquet')
+    try:
+        if parquet_file.stat().st_mtime >= Path(excel_file).stat().st_mtime:
+            return pd.read_parquet(parquet_file)
+    except OSError:
+        pass
+    return pd.read_excel(excel_file, engine='calamine')
+
+
+def write_parquet_sidecar(df: pd.DataFrame, excel_file) -> None:
+    """
+    Save a Parquet copy next to the workbook for fast reads by later stages.
+    
+    Coordinates are stored as numbers; the sidecar is only an optimization,
+    so a failure to write it is reported and otherwise ignored.
+    """
+    parquet_file = Path(excel_file).with_suffix('.parquet')
+    try:
+        sidecar = df.copy()
+        for col in ('Latitude', 'Longitude'):
+            if col in sidecar.columns:
+                sidecar[col] = pd.to_numeric(sidecar[col], errors='coerce')
+        sidecar.to_parquet(parquet_file, index=False)
+    except Exception as e:
+        print(f"Could not write Parquet copy {parquet_file}: {e}")
@@ -3,120 +3,226 @@
 Scrape Hong Kong MTR station locations and export to Excel.
 """
 
+import functools
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree, html
 import pandas as pd
 import re
-from typing import List, Dict
-import time
+from typing import List
+import operator
 import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
 
-def scrape_mtr_stations() -> List[Dict]:
+from mtr_common import RATE_LIMITER, disk_cached
+from mtr_stations_io import write_parquet_sidecar
+
+# Shared HTTP session: keep-alive connections to Wikipedia and Nominatim are
+# reused across stations instead of paying a fresh TCP/TLS handshake per call.
+# Retry also backs off on Nominatim's 429 responses.
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+})
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+))
+
+# Wikipedia tolerates a handful of parallel page fetches. Nominatim's policy
+# is single-threaded: one worker keeps at most one request in flight, and
+# mtr_common.RATE_LIMITER spaces their starts
+WIKI_WORKERS = 6
+NOMINATIM_WORKERS = 1
+
+
+_REF_RE = re.compile(r'\[\d+\]')
+_PAREN_RE = re.compile(r'\s*\([^)]+\)')
+_CHINESE_PAREN_RE = re.compile(r'\(([^)]+)\)')
+_CJK_RE = re.compile(r'[\u4e00-\u9fff]')
+# Format: params=22.284722_N_114.158611_E
+_GEOHACK_RE = re.compile(r'params=([\d.]+)_([NS])_([\d.]+)_([EW])')
+# The same, as the href of a link in raw page bytes
+_GEOHACK_HREF_RE = re.compile(rb'href="[^"]*geohack[^"]*params=([\d.]+)_([NS])_([\d.]+)_([EW])')
+# Format: "22.284722; 114.158611"
+_GEO_DEC_RE = re.compile(r'([\d.]+)\s*[;，,]\s*([\d.]+)')
+_COORD_TEXT_RE = re.compile(r'(\d+\.\d+)[°\s]*([NS])?\s*[,，\s]+\s*(\d+\.\d+)[°\s]*([EW])?')
+_CODE_RE = re.compile(r'^[A-Z]{2,3}$')
+
+# Cells mentioning any of these line names are collected into 'Lines'
+LINE_KEYWORDS = ('island', 'tseung kwan o', 'tung chung', 'airport express',
+                 'disneyland', 'east rail', 'west rail', 'south island',
+                 'kwun tong', 'tuen ma')
+_LINE_RE = re.compile('|'.join(map(re.escape, LINE_KEYWORDS)), re.IGNORECASE)
+
+_STATION_LINK_RE = re.compile(r'/wiki/[^/]+_station')
+_NON_STATION_RE = re.compile(r'list|category|template', re.IGNORECASE)
+
+# Wikipedia always serves UTF-8; without this lxml guesses latin-1 for pages
+# lacking a charset declaration
+_HTML_PARSER = html.HTMLParser(encoding='utf-8')
+
+# Compiled once; matching runs in libxml2 rather than walking the tree in Python
+_WIKITABLE_XP = etree.XPath("//table[contains(concat(' ', normalize-space(@class), ' '), ' wikitable ')]")
+_ROW_XP = etree.XPath('.//tr')
+_CELL_XP = etree.XPath('.//td | .//th')
+_GEOHACK_HREF_XP = etree.XPath(".//a[contains(@href, 'geohack')]/@href")
+# Cheap substring prefilter; _STATION_LINK_RE confirms the exact href shape
+_STATION_LINK_XP = etree.XPath("//a[contains(@href, '_station')]")
+_GEO_SPAN_XP = etree.XPath(".//span[contains(concat(' ', normalize-space(@class), ' '), ' geo ')]")
+
+
+class StationRec:
+    """
+    One scraped station. Fields hold strings, with '' for unknown values;
+    __slots__ keeps the per-row record small and free of a per-instance dict.
+    """
+    __slots__ = ('name_en', 'name_zh', 'lines', 'lat', 'lon', 'address', 'code')
+    
+    def __init__(self, name_en: str = '', name_zh: str = '', lines: str = '', lat: str = '',
+                 lon: str = '', address: str = '', code: str = ''):
+        self.name_en = name_en
+        self.name_zh = name_zh
+        self.lines = lines
+        self.lat = lat
+        self.lon = lon
+        self.address = address
+        self.code = code
+
+
+# Export column order and the StationRec attribute behind each column
+STATION_COLUMNS = {
+    'Station Name (English)': 'name_en',
+    'Station Name (Chinese)': 'name_zh',
+    'Station Code': 'code',
+    'Lines': 'lines',
+    'Latitude': 'lat',
+    'Longitude': 'lon',
+    'Address': 'address',
+}
+
+
+def _parse_page(content: bytes) -> html.HtmlElement:
+    """
+    Parse a Wikipedia page, dropping <style> and <script> elements.
+    
+    Wikipedia inlines TemplateStyles <style> tags inside table cells; without
+    this their CSS would leak into text extracted with itertext/text_content.
+    """
+    tree = html.fromstring(content, parser=_HTML_PARSER)
+    etree.strip_elements(tree, 'style', 'script', with_tail=False)
+    return tree
+
+
+def _text(element) -> str:
+    """
+    Concatenated, per-string stripped text of an element (BeautifulSoup's
+    get_text(strip=True), given a tree from _parse_page).
+    """
+    return ''.join(part.strip() for part in element.itertext())
+
+
+def scrape_mtr_stations() -> List[StationRec]:
     """
     Scrape MTR station data from Wikipedia.
-    Returns a list of dictionaries containing station information.
+    Returns a list of StationRec records.
     """
     print("Fetching MTR station data from Wikipedia...")
     
     # Wikipedia page for MTR stations
     url = "https://en.wikipedia.org/wiki/List_of_MTR_stations"
     
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-    
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        response = _SESSION.get(url, timeout=30)
         response.raise_for_status()
     except requests.RequestException as e:
         print(f"Error fetching Wikipedia page: {e}")
         return []
     
-    soup = BeautifulSoup(response.content, 'lxml')
+    tree = _parse_page(response.content)
     stations = []
     
     # Find all station tables - Wikipedia typically has tables with station data
-    tables = soup.find_all('table', {'class': 'wikitable'})
+    tables = _WIKITABLE_XP(tree)
     
     print(f"Found {len(tables)} potential data tables...")
     
     for table in tables:
-        rows = table.find_all('tr')
+        rows = _ROW_XP(table)
         
         if len(rows) < 2:
             continue
         
         # Try to identify header row to understand column structure
         header_row = rows[0]
-        headers = [th.get_text(strip=True).lower() for th in header_row.find_all(['th', 'td'])]
+        headers = [_text(th).lower() for th in _CELL_XP(header_row)]
         
         # Skip header row
         for row in rows[1:]:
-            cells = row.find_all(['td', 'th'])
+            cells = _CELL_XP(row)
             
             if len(cells) < 1:
                 continue
             
-            station_data = {
-                'Station Name (English)': '',
-                'Station Name (Chinese)': '',
-                'Lines': '',
-                'Latitude': '',
-                'Longitude': '',
-                'Address': '',
-                'Station Code': ''
-            }
+            station_data = StationRec()
             
             # Extract station name (usually in first cell or link)
             name_cell = cells[0]
             
             # Try to get name from link first (more reliable)
-            name_link = name_cell.find('a')
-            if name_link:
-                station_name = name_link.get_text(strip=True)
+            name_link = name_cell.find('.//a')
+            if name_link is not None:
+                station_name = _text(name_link)
             else:
-                station_name = name_cell.get_text(strip=True)
+                station_name = _text(name_cell)
             
             # Remove reference numbers and clean up
-            station_name = re.sub(r'\[\d+\]', '', station_name).strip()
+            station_name = _REF_RE.sub('', station_name).strip()
             
             # Check if name contains Chinese characters in parentheses
-            chinese_match = re.search(r'\(([^)]+)\)', station_name)
+            chinese_match = _CHINESE_PAREN_RE.search(station_name)
             if chinese_match:
                 chinese_name = chinese_match.group(1)
                 # Check if it contains Chinese characters
-                if any('\u4e00' <= char <= '\u9fff' for char in chinese_name):
-                    station_data['Station Name (Chinese)'] = chinese_name
+                if _CJK_RE.search(chinese_name):
+                    station_data.name_zh = chinese_name
                     # Remove Chinese name from English name
-                    station_data['Station Name (English)'] = re.sub(r'\s*\([^)]+\)', '', station_name).strip()
+                    station_data.name_en = _PAREN_RE.sub('', station_name).strip()
                 else:
-                    station_data['Station Name (English)'] = station_name
+                    station_data.name_en = station_name
             else:
-                station_data['Station Name (English)'] = station_name
+                station_data.name_en = station_name
             
             # Extract lines - look for common line names in cells
             for i, cell in enumerate(cells):
-                cell_text = cell.get_text(strip=True)
-                cell_text = re.sub(r'\[\d+\]', '', cell_text)
+                cell_text = _REF_RE.sub('', _text(cell))
                 
                 # Check if this cell contains line information
-                line_keywords = ['island', 'tseung kwan o', 'tung chung', 'airport express', 
-                               'disneyland', 'east rail', 'west rail', 'south island', 
-                               'kwun tong', 'tuen ma', 'tseung kwan o']
-                if any(keyword.lower() in cell_text.lower() for keyword in line_keywords):
-                    if not station_data['Lines']:
-                        station_data['Lines'] = cell_text
+                if _LINE_RE.search(cell_text):
+                    if not station_data.lines:
+                        station_data.lines = cell_text
                     else:
-                        station_data['Lines'] += ', ' + cell_text
+                        station_data.lines += ', ' + cell_text
             
-            # Try to find coordinates from geohack links (most reliable)
-            coord_links = row.find_all('a', href=re.compile(r'geohack'))
-            for link in coord_links:
-                href = link.get('href', '')
-                if 'geohack' in href:
+            # Cheapest first: Wikipedia's span class="geo" holds plain decimal degrees
+            for span in _GEO_SPAN_XP(row):
+                coord_match = _GEO_DEC_RE.search(span.text_content())
+                if coord_match:
+                    lat = float(coord_match.group(1))
+                    lon = float(coord_match.group(2))
+                    station_data.lat = f"{lat:.6f}"
+                    station_data.lon = f"{lon:.6f}"
+                    break
+            
+            # Then coordinates from geohack links
+            if not station_data.lat:
+                for href in _GEOHACK_HREF_XP(row):
                     # Extract coordinates from geohack URL
-                    # Format: params=22.284722_N_114.158611_E
-                    coord_match = re.search(r'params=([\d.]+)_([NS])_([\d.]+)_([EW])', href)
+                    coord_match = _GEOHACK_RE.search(href)
                     if coord_match:
                         lat_val = float(coord_match.group(1))
                         lat_dir = coord_match.group(2)
@@ -126,30 +232,16 @@ def scrape_mtr_stations() -> List[Dict]:
                         lat = lat_val if lat_dir == 'N' else -lat_val
                         lon = lon_val if lon_dir == 'E' else -lon_val
                         
-                        station_data['Latitude'] = f"{lat:.6f}"
-                        station_data['Longitude'] = f"{lon:.6f}"
+                        station_data.lat = f"{lat:.6f}"
+                        station_data.lon = f"{lon:.6f}"
                         break
             
-            # Also check for coordinate spans (Wikipedia uses span class="geo")
-            if not station_data['Latitude']:
-                geo_spans = row.find_all('span', {'class': 'geo'})
-                for span in geo_spans:
-                    geo_text = span.get_text()
-                    # Format: "22.284722; 114.158611"
-                    coord_match = re.search(r'([\d.]+)\s*[;，,]\s*([\d.]+)', geo_text)
-                    if coord_match:
-                        lat = float(coord_match.group(1))
-                        lon = float(coord_match.group(2))
-                        station_data['Latitude'] = f"{lat:.6f}"
-                        station_data['Longitude'] = f"{lon:.6f}"
-                        break
-            
-            # If no geohack link, try to find coordinates in text
-            if not station_data['Latitude']:
+            # Finally, try to find coordinates in free text
+            if not station_data.lat:
                 for cell in cells:
-                    cell_text = cell.get_text()
+                    cell_text = cell.text_content()
                     # Look for coordinate patterns like "22.284722°N 114.158611°E"
-                    coord_match = re.search(r'(\d+\.\d+)[°\s]*([NS])?\s*[,，\s]+\s*(\d+\.\d+)[°\s]*([EW])?', cell_text)
+                    coord_match = _COORD_TEXT_RE.search(cell_text)
                     if coord_match:
                         lat_val = float(coord_match.group(1))
                         lat_dir = coord_match.group(2) or 'N'
@@ -159,20 +251,20 @@ def scrape_mtr_stations() -> List[Dict]:
                         lat = lat_val if lat_dir == 'N' else -lat_val
                         lon = lon_val if lon_dir == 'E' else -lon_val
                         
-                        station_data['Latitude'] = f"{lat:.6f}"
-                        station_data['Longitude'] = f"{lon:.6f}"
+                        station_data.lat = f"{lat:.6f}"
+                        station_data.lon = f"{lon:.6f}"
                         break
             
             # Try to find station code (typically 2-3 uppercase letters)
             for cell in cells:
-                cell_text = cell.get_text(strip=True)
+                cell_text = _text(cell)
                 # MTR station codes are typically 2-3 uppercase letters
-                if re.match(r'^[A-Z]{2,3}$', cell_text) and len(cell_text) >= 2:
-                    station_data['Station Code'] = cell_text
+                if _CODE_RE.match(cell_text) and len(cell_text) >= 2:
+                    station_data.code = cell_text
                     break
             
             # Only add if we have at least a station name
-            if station_data['Station Name (English)']:
+            if station_data.name_en:
                 stations.append(station_data)
     
     print(f"Scraped {len(stations)} stations from Wikipedia tables.")
@@ -181,49 +273,42 @@ def scrape_mtr_stations() -> List[Dict]:
     if len(stations) < 50:
         print("Trying to fetch additional station data...")
         # Try alternative method
-        additional_stations = scrape_mtr_stations_alternative(soup)
-        # Merge without duplicates
-        existing_names = {s['Station Name (English)'] for s in stations}
+        additional_stations = scrape_mtr_stations_alternative(tree)
+        # Merge without duplicates, including repeats within the additional stations
+        existing_names = {s.name_en for s in stations}
         for station in additional_stations:
-            if station['Station Name (English)'] not in existing_names:
+            if station.name_en not in existing_names:
                 stations.append(station)
+                existing_names.add(station.name_en)
     
     return stations
 
 
-def scrape_mtr_stations_alternative(soup: BeautifulSoup) -> List[Dict]:
+def scrape_mtr_stations_alternative(tree: html.HtmlElement) -> List[StationRec]:
     """
     Alternative scraping method using infoboxes and station lists.
     """
     stations = []
     
     # Look for station list items or infoboxes
-    station_links = soup.find_all('a', href=re.compile(r'/wiki/[^/]+_station'))
+    station_links = [a for a in _STATION_LINK_XP(tree) if _STATION_LINK_RE.search(a.get('href', ''))]
     
     for link in station_links:
-        station_name = link.get_text(strip=True)
+        station_name = _text(link)
         if not station_name or len(station_name) < 2:
             continue
         
         # Skip if it's clearly not a station
-        if any(word in station_name.lower() for word in ['list', 'category', 'template']):
+        if _NON_STATION_RE.search(station_name):
             continue
         
-        station_data = {
-            'Station Name (English)': station_name,
-            'Station Name (Chinese)': '',
-            'Lines': '',
-            'Latitude': '',
-            'Longitude': '',
-            'Address': '',
-            'Station Code': ''
-        }
-        
-        stations.append(station_data)
+        stations.append(StationRec(name_en=station_name))
     
     return stations
 
 
+@functools.lru_cache(maxsize=None)
+@disk_cached('wikipedia')
 def get_coordinates_from_station_page(station_name: str) -> tuple:
     """
     Fetch coordinates from individual station Wikipedia page.
@@ -232,52 +317,41 @@ def get_coordinates_from_station_page(station_name: str) -> tuple:
     # Construct Wikipedia URL
     wiki_url = f"https://en.wikipedia.org/wiki/{station_name.replace(' ', '_')}_station"
     
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
-    
     try:
-        response = requests.get(wiki_url, headers=headers, timeout=10)
+        response = _SESSION.get(wiki_url, timeout=10)
         if response.status_code != 200:
             return (None, None)
         
-        soup = BeautifulSoup(response.content, 'lxml')
+        # Wikipedia's markup is regular enough to find the first geohack link
+        # straight from the raw bytes, without building a tree at all
+        coord_match = _GEOHACK_HREF_RE.search(response.content)
+        if coord_match:
+            lat_val = float(coord_match.group(1))
+            lat_dir = coord_match.group(2).decode()
+            lon_val = float(coord_match.group(3))
+            lon_dir = coord_match.group(4).decode()
+            
+            lat = lat_val if lat_dir == 'N' else -lat_val
+            lon = lon_val if lon_dir == 'E' else -lon_val
+            
+            return (lat, lon)
         
-        # Look for geohack links
-        coord_links = soup.find_all('a', href=re.compile(r'geohack'))
-        for link in coord_links:
-            href = link.get('href', '')
-            if 'geohack' in href:
-                coord_match = re.search(r'params=([\d.]+)_([NS])_([\d.]+)_([EW])', href)
-                if coord_match:
-                    lat_val = float(coord_match.group(1))
-                    lat_dir = coord_match.group(2)
-                    lon_val = float(coord_match.group(3))
-                    lon_dir = coord_match.group(4)
-                    
-                    lat = lat_val if lat_dir == 'N' else -lat_val
-                    lon = lon_val if lon_dir == 'E' else -lon_val
-                    
-                    return (lat, lon)
+        # Fall back to a full parse in case the markup is unusual
+        tree = _parse_page(response.content)
         
-        # Look for coordinates in infobox
-        infobox = soup.find('table', {'class': 'infobox'})
-        if infobox:
-            coord_links = infobox.find_all('a', href=re.compile(r'geohack'))
-            for link in coord_links:
-                href = link.get('href', '')
-                if 'geohack' in href:
-                    coord_match = re.search(r'params=([\d.]+)_([NS])_([\d.]+)_([EW])', href)
-                    if coord_match:
-                        lat_val = float(coord_match.group(1))
-                        lat_dir = coord_match.group(2)
-                        lon_val = float(coord_match.group(3))
-                        lon_dir = coord_match.group(4)
-                        
-                        lat = lat_val if lat_dir == 'N' else -lat_val
-                        lon = lon_val if lon_dir == 'E' else -lon_val
-                        
-                        return (lat, lon)
+        # Every geohack link in document order, infobox included, in one pass
+        for href in _GEOHACK_HREF_XP(tree):
+            coord_match = _GEOHACK_RE.search(href)
+            if coord_match:
+                lat_val = float(coord_match.group(1))
+                lat_dir = coord_match.group(2)
+                lon_val = float(coord_match.group(3))
+                lon_dir = coord_match.group(4)
+                
+                lat = lat_val if lat_dir == 'N' else -lat_val
+                lon = lon_val if lon_dir == 'E' else -lon_val
+                
+                return (lat, lon)
         
     except Exception as e:
         pass
@@ -285,6 +359,8 @@ def get_coordinates_from_station_page(station_name: str) -> tuple:
     return (None, None)
 
 
+@functools.lru_cache(maxsize=None)
+@disk_cached('nominatim')
 def geocode_station(station_name: str, location_hint: str = "Hong Kong") -> tuple:
     """
     Geocode station name using Nominatim (OpenStreetMap) free geocoding service.
@@ -298,13 +374,15 @@ def geocode_station(station_name: str, location_hint: str = "Hong Kong") -> tupl
             'format': 'json',
             'limit': 1
         }
+        # Nominatim's usage policy asks for an application-specific User-Agent
         headers = {
             'User-Agent': 'MTR Station Scraper'
         }
         
-        response = requests.get(url, params=params, headers=headers, timeout=10)
+        RATE_LIMITER.acquire(url)
+        response = _SESSION.get(url, params=params, headers=headers, timeout=10)
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             if data:
                 lat = float(data[0]['lat'])
                 lon = float(data[0]['lon'])
@@ -315,44 +393,54 @@ def geocode_station(station_name: str, location_hint: str = "Hong Kong") -> tupl
     return (None, None)
 
 
-def enhance_station_data(stations: List[Dict]) -> List[Dict]:
+def enhance_station_data(stations: List[StationRec]) -> List[StationRec]:
     """
     Enhance station data by fetching coordinates for stations that don't have them.
     """
     print("Enhancing station data with coordinates...")
     
-    stations_without_coords = [s for s in stations if not s['Latitude'] or not s['Longitude']]
+    stations_without_coords = [s for s in stations if not s.lat or not s.lon]
     print(f"Found {len(stations_without_coords)} stations without coordinates. Fetching...")
     
-    for i, station in enumerate(stations_without_coords, 1):
-        station_name = station['Station Name (English)']
-        print(f"  [{i}/{len(stations_without_coords)}] Fetching coordinates for {station_name}...")
-        
-        # Try to get from individual station page first
-        lat, lon = get_coordinates_from_station_page(station_name)
-        
-        # If not found, try geocoding
-        if lat is None or lon is None:
-            lat, lon = geocode_station(station_name)
-        
-        if lat is not None and lon is not None:
-            # Validate coordinates are in Hong Kong
-            if 22.0 <= lat <= 23.0 and 113.0 <= lon <= 115.0:
-                station['Latitude'] = f"{lat:.6f}"
-                station['Longitude'] = f"{lon:.6f}"
-                print(f"    ✓ Found coordinates: {lat:.6f}, {lon:.6f}")
-            else:
-                print(f"    ✗ Coordinates out of range: {lat:.6f}, {lon:.6f}")
-        else:
-            print(f"    ✗ Could not find coordinates")
-        
-        # Be polite to the API - add a small delay
-        time.sleep(1)
+    total = len(stations_without_coords)
+    
+    # Try individual station pages first, several at a time. Each miss is
+    # queued for geocoding as soon as it comes back, so Nominatim lookups run
+    # while the remaining pages are still being fetched. Stations are reported
+    # as their lookup settles, in completion order.
+    with ThreadPoolExecutor(max_workers=WIKI_WORKERS) as wiki_pool, \
+            ThreadPoolExecutor(max_workers=NOMINATIM_WORKERS) as nominatim_pool:
+        # future -> (station, whether this lookup is the Nominatim fallback)
+        pending = {wiki_pool.submit(get_coordinates_from_station_page, station.name_en): (station, False)
+                   for station in stations_without_coords}
+        done_count = 0
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                station, geocoded = pending.pop(future)
+                lat, lon = future.result()
+                if (lat is None or lon is None) and not geocoded:
+                    pending[nominatim_pool.submit(geocode_station, station.name_en)] = (station, True)
+                    continue
+                
+                done_count += 1
+                print(f"  [{done_count}/{total}] {station.name_en}")
+                
+                if lat is not None and lon is not None:
+                    # Validate coordinates are in Hong Kong
+                    if 22.0 <= lat <= 23.0 and 113.0 <= lon <= 115.0:
+                        station.lat = f"{lat:.6f}"
+                        station.lon = f"{lon:.6f}"
+                        print(f"    ✓ Found coordinates: {lat:.6f}, {lon:.6f}")
+                    else:
+                        print(f"    ✗ Coordinates out of range: {lat:.6f}, {lon:.6f}")
+                else:
+                    print(f"    ✗ Could not find coordinates")
     
     return stations
 
 
-def clean_and_validate_data(stations: List[Dict]) -> List[Dict]:
+def clean_and_validate_data(stations: List[StationRec]) -> List[StationRec]:
     """
     Clean and validate the scraped station data.
     """
@@ -363,30 +451,30 @@ def clean_and_validate_data(stations: List[Dict]) -> List[Dict]:
     
     for station in stations:
         # Remove duplicates based on station name
-        name = station['Station Name (English)'].strip()
+        name = station.name_en.strip()
         if not name or name in seen_names:
             continue
         
         seen_names.add(name)
         
         # Clean up lines data
-        if station['Lines']:
+        if station.lines:
             # Remove extra whitespace and normalize
-            station['Lines'] = ' '.join(station['Lines'].split())
+            station.lines = ' '.join(station.lines.split())
         
         # Validate coordinates
-        if station['Latitude'] and station['Longitude']:
+        if station.lat and station.lon:
             try:
-                lat = float(station['Latitude'])
-                lon = float(station['Longitude'])
+                lat = float(station.lat)
+                lon = float(station.lon)
                 # Hong Kong is roughly between 22.1-22.6 N and 113.8-114.4 E
                 if not (22.0 <= lat <= 23.0) or not (113.0 <= lon <= 115.0):
                     # Coordinates might be invalid, clear them
-                    station['Latitude'] = ''
-                    station['Longitude'] = ''
+                    station.lat = ''
+                    station.lon = ''
             except ValueError:
-                station['Latitude'] = ''
-                station['Longitude'] = ''
+                station.lat = ''
+                station.lon = ''
         
         cleaned_stations.append(station)
     
@@ -394,12 +482,11 @@ def clean_and_validate_data(stations: List[Dict]) -> List[Dict]:
     return cleaned_stations
 
 
-def export_to_excel(stations: List[Dict], filename: str = None):
+def export_to_excel(stations: List[StationRec], filename: str = None):
     """
     Export station data to Excel file.
     """
     if filename is None:
-        from pathlib import Path
         project_root = Path(__file__).parent.parent.parent
         filename = project_root / 'data' / 'raw' / 'mtr' / 'mtr_stations.xlsx'
         os.makedirs(Path(filename).parent, exist_ok=True)
@@ -410,23 +497,9 @@ def export_to_excel(stations: List[Dict], filename: str = None):
         print("No stations to export!")
         return
     
-    # Create DataFrame
-    df = pd.DataFrame(stations)
-    
-    # Reorder columns for better readability
-    column_order = [
-        'Station Name (English)',
-        'Station Name (Chinese)',
-        'Station Code',
-        'Lines',
-        'Latitude',
-        'Longitude',
-        'Address'
-    ]
-    
-    # Only include columns that exist
-    column_order = [col for col in column_order if col in df.columns]
-    df = df[column_order]
+    # Create DataFrame, with columns ordered for readability
+    row = operator.attrgetter(*STATION_COLUMNS.values())
+    df = pd.DataFrame.from_records([row(s) for s in stations], columns=list(STATION_COLUMNS))
     
     # Export to Excel
     try:
@@ -435,15 +508,15 @@ def export_to_excel(stations: List[Dict], filename: str = None):
             
             # Auto-adjust column widths
             worksheet = writer.sheets['MTR Stations']
+            # One vectorized pass over a nullable-string copy rather than len() per cell
+            widths = df.astype('string').fillna('').apply(lambda s: s.str.len().max())
             for idx, col in enumerate(df.columns):
-                max_length = max(
-                    df[col].astype(str).apply(len).max(),
-                    len(col)
-                )
+                max_length = max(widths[col], len(col))
                 worksheet.column_dimensions[chr(65 + idx)].width = min(max_length + 2, 50)
+        write_parquet_sidecar(df, filename)
         
         # Count stations with coordinates
-        stations_with_coords = sum(1 for s in stations if s.get('Latitude') and s.get('Longitude'))
+        stations_with_coords = sum(1 for s in stations if s.lat and s.lon)
         
         print(f"Successfully exported to {filename}")
         print(f"Total stations: {len(stations)}")
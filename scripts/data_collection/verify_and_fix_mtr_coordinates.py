@@ -4,12 +4,41 @@ Verify and fix MTR station coordinates using OpenStreetMap as a reliable source.
 This script fetches accurate coordinates from OSM and updates the station data.
 """
 
+import functools
+import numpy as np
+import orjson
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 from pathlib import Path
-import json
+from concurrent.futures import ThreadPoolExecutor
 
+from mtr_common import RATE_LIMITER, disk_cached
+from mtr_stations_io import read_mtr_stations, write_parquet_sidecar
+
+# Shared HTTP session: the keep-alive connection to Nominatim is reused across
+# stations instead of paying a fresh TCP/TLS handshake per call. Retry also
+# backs off on 429 responses. Nominatim's usage policy asks for an
+# application-specific User-Agent.
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'MTR Station Coordinate Verifier (research project)'
+})
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+))
+
+# Nominatim's policy is single-threaded: one worker keeps at most one request
+# in flight, and mtr_common.RATE_LIMITER spaces their starts.
+NOMINATIM_WORKERS = 1
+
+
+@functools.lru_cache(maxsize=None)
+@disk_cached('osm')
 def get_osm_coordinates(station_name: str, location_hint: str = "Hong Kong") -> tuple:
     """
     Get accurate coordinates from OpenStreetMap using Overpass API.
@@ -24,13 +53,11 @@ def get_osm_coordinates(station_name: str, location_hint: str = "Hong Kong") ->
             'limit': 1,
             'addressdetails': 1
         }
-        headers = {
-            'User-Agent': 'MTR Station Coordinate Verifier (research project)'
-        }
         
-        response = requests.get(url, params=params, headers=headers, timeout=10)
+        RATE_LIMITER.acquire(url)
+        response = _SESSION.get(url, params=params, timeout=10)
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             if data and len(data) > 0:
                 result = data[0]
                 lat = float(result['lat'])
@@ -42,9 +69,10 @@ def get_osm_coordinates(station_name: str, location_hint: str = "Hong Kong") ->
         
         # Try alternative search without "MTR"
         params['q'] = f"{station_name} station, {location_hint}"
-        response = requests.get(url, params=params, headers=headers, timeout=10)
+        RATE_LIMITER.acquire(url)
+        response = _SESSION.get(url, params=params, timeout=10)
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             if data and len(data) > 0:
                 result = data[0]
                 lat = float(result['lat'])
@@ -59,6 +87,19 @@ def get_osm_coordinates(station_name: str, location_hint: str = "Hong Kong") ->
     return (None, None)
 
 
+def haversine(lon1, lat1, lon2, lat2):
+    """
+    Calculate distance in meters between points given as arrays of degrees.
+    """
+    R = 6371000  # Earth radius in meters
+    lon1, lat1, lon2, lat2 = map(np.radians, (lon1, lat1, lon2, lat2))
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    a = np.sin(dlat/2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon/2)**2
+    c = 2 * np.arcsin(np.sqrt(a))
+    return R * c
+
+
 def verify_and_update_coordinates(input_file: str = None, output_file: str = None):
     """
     Verify and update MTR station coordinates using OpenStreetMap.
@@ -79,76 +120,74 @@ def verify_and_update_coordinates(input_file: str = None, output_file: str = Non
     print("=" * 60)
     
     # Load existing data
-    df = pd.read_excel(input_file)
+    df = read_mtr_stations(input_file)
     
     # Filter stations with names (exclude invalid entries)
-    valid_stations = df[df['Station Name (English)'].notna() & 
-                       (df['Station Name (English)'].str.len() > 2) &
-                       (~df['Station Name (English)'].str.contains('Wikimedia|Article|Talk|Read|Français', case=False, na=False))]
+    # Missing names fail the contains() test (na=True), so no separate notna() pass
+    names = df['Station Name (English)'].astype('string')
+    valid_stations = df.loc[names.str.len().gt(2) &
+                            ~names.str.contains('Wikimedia|Article|Talk|Read|Français', case=False, na=True)]
     
     print(f"\nFound {len(valid_stations)} valid stations to verify")
-    print("\nVerifying coordinates...")
+    print("\nQuerying OpenStreetMap...")
     
-    updated_count = 0
-    verified_count = 0
-    failed_count = 0
+    current_lat = pd.to_numeric(valid_stations['Latitude'], errors='coerce')
+    current_lon = pd.to_numeric(valid_stations['Longitude'], errors='coerce')
     
-    for idx, row in valid_stations.iterrows():
-        station_name = row['Station Name (English)']
-        current_lat = row.get('Latitude', None)
-        current_lon = row.get('Longitude', None)
-        
-        # Skip if already has valid coordinates
-        has_coords = (pd.notna(current_lat) and pd.notna(current_lon) and 
-                     22.0 <= float(current_lat) <= 23.0 and 
-                     113.0 <= float(current_lon) <= 115.0)
-        
-        if has_coords:
-            # Verify existing coordinates
-            print(f"  [{idx+1}/{len(valid_stations)}] Verifying {station_name}...", end=' ')
-            osm_lat, osm_lon = get_osm_coordinates(station_name)
-            
-            if osm_lat and osm_lon:
-                # Check if coordinates are significantly different (>100m)
-                from math import radians, cos, sin, asin, sqrt
-                def haversine(lon1, lat1, lon2, lat2):
-                    """Calculate distance between two points in meters"""
-                    R = 6371000  # Earth radius in meters
-                    dlat = radians(lat2 - lat1)
-                    dlon = radians(lon2 - lon1)
-                    a = sin(dlat/2)**2 + cos(radians(lat1)) * cos(radians(lat2)) * sin(dlon/2)**2
-                    c = 2 * asin(sqrt(a))
-                    return R * c
-                
-                distance = haversine(float(current_lon), float(current_lat), osm_lon, osm_lat)
-                
-                if distance > 100:  # More than 100m difference
-                    print(f"⚠️  UPDATE NEEDED (distance: {distance:.0f}m)")
-                    df.at[idx, 'Latitude'] = float(f"{osm_lat:.6f}")
-                    df.at[idx, 'Longitude'] = float(f"{osm_lon:.6f}")
-                    updated_count += 1
-                else:
-                    print(f"✓ Verified (distance: {distance:.0f}m)")
-                    verified_count += 1
+    # Stations whose existing coordinates fall within Hong Kong are verified
+    # against OSM; the rest are filled in from OSM where it has a result
+    has_coords = current_lat.between(22.0, 23.0) & current_lon.between(113.0, 115.0)
+    
+    # Report each lookup as it returns (map yields in order, so output stays
+    # sorted); the comparison against existing coordinates is vectorized below.
+    # Plain Python lists: no per-row Series boxing or label lookups.
+    osm_results = {}
+    # Names as filtered above: calamine can read a purely numeric name as a float
+    station_names = names.loc[valid_stations.index].tolist()
+    with ThreadPoolExecutor(max_workers=NOMINATIM_WORKERS) as executor:
+        rows = zip(valid_stations.index.tolist(), station_names, has_coords.tolist(),
+                   executor.map(get_osm_coordinates, station_names))
+        for i, (idx, station_name, row_has_coords, (osm_lat, osm_lon)) in enumerate(rows, 1):
+            osm_results[idx] = (osm_lat, osm_lon)
+            action = "Verifying" if row_has_coords else "Fetching"
+            print(f"  [{i}/{len(valid_stations)}] {action} {station_name}...", end=' ')
+            if osm_lat is None or osm_lon is None:
+                print("⚠️  Could not verify (keeping existing)" if row_has_coords else "✗ Not found")
             else:
-                print("⚠️  Could not verify (keeping existing)")
-                verified_count += 1
-        else:
-            # Fetch new coordinates
-            print(f"  [{idx+1}/{len(valid_stations)}] Fetching {station_name}...", end=' ')
-            osm_lat, osm_lon = get_osm_coordinates(station_name)
-            
-            if osm_lat and osm_lon:
-                df.at[idx, 'Latitude'] = float(f"{osm_lat:.6f}")
-                df.at[idx, 'Longitude'] = float(f"{osm_lon:.6f}")
                 print(f"✓ Found: {osm_lat:.6f}, {osm_lon:.6f}")
-                updated_count += 1
-            else:
-                print("✗ Not found")
-                failed_count += 1
-        
-        # Be polite to the API
-        time.sleep(1)
+    
+    print("\nVerifying coordinates...")
+    
+    # Float columns, so misses are NaN even when no lookup succeeded at all
+    osm = pd.DataFrame.from_dict(osm_results, orient='index',
+                                 columns=['Latitude', 'Longitude'], dtype=float)
+    found = osm['Latitude'].notna() & osm['Longitude'].notna()
+    if found.any():
+        distances = pd.Series(
+            haversine(current_lon.to_numpy(), current_lat.to_numpy(),
+                      osm['Longitude'].to_numpy(), osm['Latitude'].to_numpy()),
+            index=valid_stations.index
+        )
+    else:
+        distances = pd.Series(np.nan, index=valid_stations.index)
+    # Existing coordinates more than 100m from OSM are replaced
+    needs_update = found & (~has_coords | (distances > 100))
+    
+    checked = has_coords & found
+    rows = zip(names.loc[valid_stations.index][checked].tolist(),
+               needs_update[checked].tolist(), distances[checked].tolist())
+    for station_name, row_needs_update, distance in rows:
+        if row_needs_update:
+            print(f"  {station_name}: ⚠️  UPDATE NEEDED (distance: {distance:.0f}m)")
+        else:
+            print(f"  {station_name}: ✓ Verified (distance: {distance:.0f}m)")
+    
+    update_index = needs_update[needs_update].index
+    df.loc[update_index, ['Latitude', 'Longitude']] = osm.loc[update_index].round(6).to_numpy()
+    
+    updated_count = int(needs_update.sum())
+    verified_count = int((has_coords & ~needs_update).sum())
+    failed_count = int((~has_coords & ~found).sum())
     
     # Save updated data
     print(f"\n{'='*60}")
@@ -164,12 +203,12 @@ def verify_and_update_coordinates(input_file: str = None, output_file: str = Non
         
         # Auto-adjust column widths
         worksheet = writer.sheets['MTR Stations']
+        # One vectorized pass over a nullable-string copy rather than len() per cell
+        widths = df.astype('string').fillna('').apply(lambda s: s.str.len().max())
         for idx, col in enumerate(df.columns):
-            max_length = max(
-                df[col].astype(str).apply(len).max(),
-                len(col)
-            )
+            max_length = max(widths[col], len(col))
             worksheet.column_dimensions[chr(65 + idx)].width = min(max_length + 2, 50)
+    write_parquet_sidecar(df, output_file)
     
     print(f"\nUpdated data saved to: {output_file}")
     
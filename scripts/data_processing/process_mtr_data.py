@@ -8,6 +8,12 @@ import geopandas as gpd
 from shapely.geometry import Point
 from pathlib import Path
 import os
+import sys
+
+# The station reader lives with the data collection scripts; mtr_stations_io
+# has no import-time side effects
+sys.path.insert(0, str(Path(__file__).parent.parent / 'data_collection'))
+from mtr_stations_io import read_mtr_stations
 
 def load_mtr_stations(excel_file: Path = None) -> gpd.GeoDataFrame:
     """
@@ -20,7 +26,7 @@ def load_mtr_stations(excel_file: Path = None) -> gpd.GeoDataFrame:
     print(f"Loading MTR stations from {excel_file}...")
     
     try:
-        df = pd.read_excel(excel_file)
+        df = read_mtr_stations(excel_file)
         
         # Filter stations with valid coordinates
         df = df[df['Latitude'].notna() & df['Longitude'].notna()]
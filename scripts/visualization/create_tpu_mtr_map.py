@@ -7,10 +7,16 @@ import geopandas as gpd
 import pandas as pd
 import json
 import os
+import sys
 from pathlib import Path
 import folium
 from folium import plugins
 
+# The station reader lives with the data collection scripts; mtr_stations_io
+# has no import-time side effects
+sys.path.insert(0, str(Path(__file__).parent.parent / 'data_collection'))
+from mtr_stations_io import read_mtr_stations
+
 def load_mtr_stations(excel_file: str = None) -> pd.DataFrame:
     """
     Load MTR station data from Excel file.
@@ -22,7 +28,7 @@ def load_mtr_stations(excel_file: str = None) -> pd.DataFrame:
     Load MTR station data from Excel file.
     """
     try:
-        df = pd.read_excel(excel_file)
+        df = read_mtr_stations(excel_file)
         # Filter stations with valid coordinates
         df = df[df['Latitude'].notna() & df['Longitude'].notna()]
         df['Latitude'] = pd.to_numeric(df['Latitude'], errors='coerce')